@@ -1,155 +1,325 @@
 """Example demonstrating communication between Daytona agent and Coder agent."""
+import asyncio
 import os
-import sys
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Union
 
-# Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing_extensions import Literal
 
 from src.agent.daytona_agent import DaytonaSandboxAgent
 from src.agent.a2a_integration import A2AIntegration
+from src.agent.warm_pool import WarmPool
 from src.config import get_template_by_id, get_resource_config
-from google.adk.models import Gemini
-from google.adk.tools import FunctionTool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_agent() -> DaytonaSandboxAgent:
-    """Create and configure the Daytona agent.
-    
-    Returns:
-        Configured agent.
-    """
-    # Create LLM
-    llm = Gemini(model="gemini-2.0-flash")
-    
-    # Create agent
-    agent = DaytonaSandboxAgent(
-        name="daytona_sandbox_agent",
-        model=llm,
-        description="An agent that orchestrates Daytona sandbox environments",
-    )
-    
-    # Set up A2A integration
-    a2a = A2AIntegration("http://localhost:8080")
-    agent.a2a = a2a
-    
-    # Add communication methods
-    agent.connect_to_coder_agent = connect_to_coder_agent.__get__(agent)
-    agent.send_message_to_coder = send_message_to_coder.__get__(agent)
-    agent.handle_coder_request = handle_coder_request.__get__(agent)
-    
-    # Register tools
-    agent.register_tool(FunctionTool(agent.connect_to_coder_agent))
-    agent.register_tool(FunctionTool(agent.send_message_to_coder))
-    agent.register_tool(FunctionTool(agent.handle_coder_request))
-    
-    return agent
+# How many coder requests may be handled concurrently per request type
+DEFAULT_HANDLER_CONCURRENCY = int(os.getenv("DAGENT_HANDLER_CONCURRENCY", "4"))
 
-def connect_to_coder_agent(self, coder_agent_id: str) -> Dict[str, Any]:
-    """Connect to the coder agent.
-    
-    Args:
-        coder_agent_id: The ID of the coder agent.
-        
-    Returns:
-        Connection status.
-    """
-    logger.info(f"Connecting to coder agent: {coder_agent_id}")
-    connection = self.a2a.connect_to_agent(coder_agent_id)
-    
-    return {
-        "status": "connected",
-        "agent_id": coder_agent_id,
-        "connection_id": id(connection)
-    }
-
-def send_message_to_coder(self, coder_agent_id: str, message: str) -> Dict[str, Any]:
-    """Send a message to the coder agent.
-    
-    Args:
-        coder_agent_id: The ID of the coder agent.
-        message: The message to send.
-        
-    Returns:
-        Response from the coder agent.
+# Pre-resolve the template/size pairs the example workflows use so the
+# first request also hits the config caches
+for _template_id, _size in (("python-dev", "small"), ("node-dev", "medium")):
+    get_template_by_id(_template_id)
+    get_resource_config(_size)
+
+class RequestDispatcher:
+    """Dispatches coder requests concurrently with per-type limits.
+
+    Sandbox operations are I/O-bound, so handling requests one at a time
+    leaves most of the latency on the table. The dispatcher runs each
+    request in a worker thread, limited by a semaphore per request type so
+    a burst of slow creates cannot starve deletes.
     """
-    logger.info(f"Sending message to coder agent {coder_agent_id}: {message}")
-    response = self.a2a.send_message(coder_agent_id, message)
-    logger.info(f"Response from coder agent: {response}")
-    
-    return response
-
-def handle_coder_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle a request from the coder agent.
-    
+
+    def __init__(self,
+                agent: DaytonaSandboxAgent,
+                concurrency: int = DEFAULT_HANDLER_CONCURRENCY):
+        """Initialize the dispatcher.
+
+        Args:
+            agent: The agent whose handle_coder_request should be dispatched.
+            concurrency: Maximum concurrent requests per request type.
+        """
+        self.agent = agent
+        self._semaphores = {
+            "create_sandbox": asyncio.Semaphore(concurrency),
+            "delete_sandbox": asyncio.Semaphore(concurrency),
+        }
+        self._default_semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single coder request under the concurrency limit.
+
+        Args:
+            request: The request from the coder agent.
+
+        Returns:
+            Response to the coder agent.
+        """
+        semaphore = self._semaphores.get(
+            request.get("type"), self._default_semaphore
+        )
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self.agent.handle_coder_request, request
+            )
+
+    async def handle_many(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """Handle several coder requests concurrently.
+
+        Args:
+            requests: The requests from the coder agent.
+
+        Returns:
+            One response (or exception) per request, in order. A slow
+            create does not block deletes queued behind it.
+        """
+        return await asyncio.gather(
+            *(self.handle(request) for request in requests),
+            return_exceptions=True
+        )
+
+class CreateSandboxRequest(BaseModel):
+    """A create_sandbox request from the coder agent."""
+
+    type: Literal["create_sandbox"]
+    name: Optional[str] = None
+    template_id: str = "python-dev"
+    resource_size: str = "small"
+
+class DeleteSandboxRequest(BaseModel):
+    """A delete_sandbox request from the coder agent."""
+
+    type: Literal["delete_sandbox"]
+    sandbox_id: Optional[str] = None
+
+# Validates the incoming dict once; the handlers then use C-level
+# attribute access instead of chained dict.get calls
+_REQUEST_ADAPTER = TypeAdapter(Union[CreateSandboxRequest, DeleteSandboxRequest])
+
+def _handle_create_sandbox(self, request: CreateSandboxRequest) -> Dict[str, Any]:
+    """Handle a create_sandbox request from the coder agent.
+
     Args:
-        request: The request from the coder agent.
-        
+        request: The parsed request from the coder agent.
+
     Returns:
         Response to the coder agent.
     """
-    logger.info(f"Handling request from coder agent: {request}")
-    
-    request_type = request.get("type")
-    
-    if request_type == "create_sandbox":
-        # Extract request details
-        template_id = request.get("template_id", "python-dev")
-        resource_size = request.get("resource_size", "small")
-        
-        # Get template and resource config
-        try:
-            template = get_template_by_id(template_id)
-            resources = get_resource_config(resource_size)
-            
-            # Create sandbox
+    template_id = request.template_id
+    resource_size = request.resource_size
+
+    # Get template and resource config
+    try:
+        template = get_template_by_id(template_id)
+        resources = get_resource_config(resource_size)
+        name = request.name or f"sandbox-{template_id}"
+
+        # Claim a warm sandbox when one is available, falling back to
+        # a cold create on a pool miss
+        pool = getattr(self, "_warm_pool", None)
+        sandbox = pool.acquire(template_id, resource_size, name) if pool else None
+        if sandbox is not None:
+            pool.replenish_async(template_id, resource_size)
+        else:
             sandbox = self.create_sandbox(
-                name=request.get("name", f"sandbox-{template_id}"),
+                name=name,
                 template=template_id,
-                resources=resources
+                resources=dict(resources)
             )
-            
-            return {
-                "status": "success",
-                "sandbox": sandbox,
-                "message": f"Created sandbox {sandbox['id']} with {template_id} template"
-            }
-        except ValueError as e:
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-    
-    elif request_type == "delete_sandbox":
-        sandbox_id = request.get("sandbox_id")
-        
-        if not sandbox_id:
+
+        return {
+            "status": "success",
+            "sandbox": sandbox,
+            "message": f"Created sandbox {sandbox['id']} with {template_id} template"
+        }
+    except ValueError as e:
+        return {
+            "status": "error",
+            "error": str(e)
+        }
+
+def _handle_delete_sandbox(self, request: DeleteSandboxRequest) -> Dict[str, Any]:
+    """Handle a delete_sandbox request from the coder agent.
+
+    Args:
+        request: The parsed request from the coder agent.
+
+    Returns:
+        Response to the coder agent.
+    """
+    sandbox_id = request.sandbox_id
+
+    if not sandbox_id:
+        return {
+            "status": "error",
+            "error": "sandbox_id is required"
+        }
+
+    try:
+        result = self.delete_sandbox(sandbox_id)
+        return {
+            "status": "success",
+            "message": f"Deleted sandbox {sandbox_id}"
+        }
+    except ValueError as e:
+        return {
+            "status": "error",
+            "error": str(e)
+        }
+
+# Dispatch table and shared error skeleton, built once at import time so
+# the handler body is a single dict lookup per request
+_HANDLERS = {
+    "create_sandbox": _handle_create_sandbox,
+    "delete_sandbox": _handle_delete_sandbox,
+}
+
+_UNKNOWN_ERROR = {
+    "status": "error",
+    "error": "Unknown request type",
+}
+
+class CoderCommunicationMixin:
+    """Coder-agent communication methods for a Daytona agent.
+
+    Defining these as class-level methods (instead of binding free
+    functions onto each instance with __get__) keeps method lookup on
+    the MRO cache and avoids per-instance bound-method allocations.
+    """
+
+    def connect_to_coder_agent(self, coder_agent_id: str) -> Dict[str, Any]:
+        """Connect to the coder agent.
+
+        Args:
+            coder_agent_id: The ID of the coder agent.
+
+        Returns:
+            Connection status.
+        """
+        logger.info("Connecting to coder agent: %s", coder_agent_id)
+        connection = self._a2a_client.connect_to_agent(coder_agent_id)
+
+        return {
+            "status": "connected",
+            "agent_id": coder_agent_id,
+            "connection_id": id(connection)
+        }
+
+    def send_message_to_coder(self, coder_agent_id: str, message: str) -> Dict[str, Any]:
+        """Send a message to the coder agent.
+
+        Args:
+            coder_agent_id: The ID of the coder agent.
+            message: The message to send.
+
+        Returns:
+            Response from the coder agent.
+        """
+        logger.info("Sending message to coder agent %s: %s", coder_agent_id, message)
+        response = self._a2a_client.send_message(coder_agent_id, message)
+        logger.info("Response from coder agent: %s", response)
+
+        return response
+
+    def handle_coder_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a request from the coder agent.
+
+        Args:
+            request: The request from the coder agent.
+
+        Returns:
+            Response to the coder agent.
+        """
+        logger.info("Handling request from coder agent: %s", request)
+
+        request_type = request.get("type")
+        handler = _HANDLERS.get(request_type)
+
+        if handler is None:
             return {
-                "status": "error",
-                "error": "sandbox_id is required"
+                **_UNKNOWN_ERROR,
+                "error": f"Unknown request type: {request_type}"
             }
-        
+
         try:
-            result = self.delete_sandbox(sandbox_id)
-            return {
-                "status": "success",
-                "message": f"Deleted sandbox {sandbox_id}"
-            }
-        except ValueError as e:
+            parsed = _REQUEST_ADAPTER.validate_python(request)
+        except ValidationError as e:
             return {
                 "status": "error",
                 "error": str(e)
             }
-    
-    else:
-        return {
-            "status": "error",
-            "error": f"Unknown request type: {request_type}"
-        }
+
+        return handler(self, parsed)
+
+class CoderDaytonaAgent(CoderCommunicationMixin, DaytonaSandboxAgent):
+    """Daytona agent that also speaks to the coder agent."""
+
+    def __init__(self, name: str = "daytona_sandbox_agent", **kwargs: Any):
+        """Initialize the agent with the communication tools registered.
+
+        LlmAgent has no post-construction register_tool hook, so the
+        communication methods are wrapped and passed through the tools
+        kwarg here, the same way DaytonaSandboxAgent registers its
+        sandbox tools.
+
+        Args:
+            name: The name of the agent.
+            **kwargs: Additional arguments to pass to the parent class.
+        """
+        from google.adk.tools import FunctionTool
+
+        communication_tools = [
+            FunctionTool(method)
+            for method in (
+                self.connect_to_coder_agent,
+                self.send_message_to_coder,
+                self.handle_coder_request,
+            )
+        ]
+
+        kwargs["tools"] = kwargs.get("tools", []) + communication_tools
+
+        super().__init__(name=name, **kwargs)
+
+def create_agent() -> DaytonaSandboxAgent:
+    """Create and configure the Daytona agent.
+
+    Returns:
+        Configured agent.
+    """
+    # Imported here so the ADK SDK is only loaded when an agent is built
+    from google.adk.models import Gemini
+
+    # Create LLM
+    llm = Gemini(model="gemini-2.0-flash")
+
+    # Create agent; the communication tools are registered through the
+    # constructor's tools kwarg
+    agent = CoderDaytonaAgent(
+        name="daytona_sandbox_agent",
+        model=llm,
+        description="An agent that orchestrates Daytona sandbox environments",
+    )
+
+    # Set up A2A integration (shared per host across agents)
+    a2a = A2AIntegration.for_host("http://localhost:8080")
+    agent._a2a_client = a2a
+
+    # Pre-warm sandboxes for the common template/size combinations so
+    # create requests can claim one instead of cold-starting
+    agent._warm_pool = WarmPool(
+        create_sandbox=agent.create_sandbox,
+        resources_for=get_resource_config,
+        templates=("python-dev", "node-dev"),
+        sizes=("small", "medium")
+    )
+
+    return agent
 
 def main() -> None:
     """Main entry point for the example."""
@@ -157,12 +327,12 @@ def main() -> None:
         # Create agent
         agent = create_agent()
         logger.info("Daytona agent created and initialized")
-        
+
         # Connect to coder agent (example)
         coder_agent_id = "coder-agent-1"
         connection = agent.connect_to_coder_agent(coder_agent_id)
-        logger.info(f"Connection established: {connection}")
-        
+        logger.info("Connection established: %s", connection)
+
         # Simulate receiving a request from the coder agent
         example_request = {
             "type": "create_sandbox",
@@ -170,20 +340,20 @@ def main() -> None:
             "template_id": "python-dev",
             "resource_size": "medium"
         }
-        
+
         # Handle the request
         response = agent.handle_coder_request(example_request)
-        logger.info(f"Response to coder request: {response}")
-        
+        logger.info("Response to coder request: %s", response)
+
         # Send a message to the coder agent
         if response["status"] == "success":
             message = f"Your sandbox {response['sandbox']['id']} is ready at {response['sandbox']['url']}"
             agent.send_message_to_coder(coder_agent_id, message)
-        
+
         logger.info("Example completed")
-        
+
     except Exception as e:
-        logger.error(f"Error in example: {e}", exc_info=True)
+        logger.error("Error in example: %s", e, exc_info=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,13 +1,8 @@
 """Example workflow between Daytona agent and Coder agent."""
-import os
-import sys
 import logging
 import json
 from typing import Dict, Any, List
 
-# Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.agent.daytona_agent import DaytonaSandboxAgent
 from src.agent.a2a_integration import A2AIntegration
 from google.adk.models import Gemini
@@ -16,6 +11,26 @@ from google.adk.models import Gemini
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer orjson's native encoder when available; its dumps is several
+# times faster than stdlib json on nested dicts
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+class _LazyJSON:
+    """Defers JSON encoding until a log record is actually formatted."""
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj)
+
 class WorkflowSimulator:
     """Simulates a workflow between Daytona agent and Coder agent."""
     
@@ -68,8 +83,8 @@ class WorkflowSimulator:
             model=llm
         )
         
-        # Set up A2A integration
-        a2a = A2AIntegration("http://localhost:8080")
+        # Set up A2A integration (shared per host across agents)
+        a2a = A2AIntegration.for_host("http://localhost:8080")
         agent._a2a_client = a2a
         
         # Communication tools are already registered in the agent
@@ -83,15 +98,23 @@ class WorkflowSimulator:
         # Step 1: Coder agent requests environment
         logger.info("Step 1: Coder agent requests environment")
         coder_request = self.coder_responses["request_environment"]
-        
-        # Daytona agent creates sandbox
-        sandbox = self.daytona_agent.create_sandbox(
-            name=coder_request["name"],
-            template=coder_request["template_id"],
-            resources={"size": coder_request["resource_size"]}
-        )
-        
-        logger.info(f"Created sandbox: {json.dumps(sandbox, indent=2)}")
+
+        # Submit the Daytona-side operations as one pipeline; results
+        # stream back as each step completes, so the coder-side exchange
+        # below runs while the delete step is still pending
+        pipeline = self.daytona_agent.run_pipeline([
+            {
+                "type": "create_sandbox",
+                "name": coder_request["name"],
+                "template": coder_request["template_id"],
+                "resources": {"size": coder_request["resource_size"]}
+            },
+            {"type": "delete_sandbox"}
+        ])
+
+        sandbox = next(pipeline)["result"]
+
+        logger.info("Created sandbox: %s", _LazyJSON(sandbox))
         
         # Step 2: Daytona agent notifies coder agent
         logger.info("Step 2: Daytona agent notifies coder agent")
@@ -105,19 +128,19 @@ class WorkflowSimulator:
             }
         }
         
-        logger.info(f"Notification to coder agent: {json.dumps(notification, indent=2)}")
+        logger.info("Notification to coder agent: %s", _LazyJSON(notification))
         
         # Step 3: Coder agent acknowledges
         logger.info("Step 3: Coder agent acknowledges")
         acknowledge = self.coder_responses["acknowledge_environment"]
-        logger.info(f"Acknowledgment from coder agent: {json.dumps(acknowledge, indent=2)}")
+        logger.info("Acknowledgment from coder agent: %s", _LazyJSON(acknowledge))
         
         # Step 4: Coder agent requests code execution
         logger.info("Step 4: Coder agent requests code execution")
         execution_request = self.coder_responses["request_code_execution"]
         execution_request["sandbox_id"] = sandbox["id"]
         
-        logger.info(f"Execution request from coder agent: {json.dumps(execution_request, indent=2)}")
+        logger.info("Execution request from coder agent: %s", _LazyJSON(execution_request))
         
         # Daytona agent simulates execution
         execution_result = {
@@ -126,20 +149,20 @@ class WorkflowSimulator:
             "sandbox_id": sandbox["id"]
         }
         
-        logger.info(f"Execution result: {json.dumps(execution_result, indent=2)}")
+        logger.info("Execution result: %s", _LazyJSON(execution_result))
         
         # Step 5: Coder agent completes task
         logger.info("Step 5: Coder agent completes task")
         completion = self.coder_responses["complete_task"]
         completion["sandbox_id"] = sandbox["id"]
         
-        logger.info(f"Completion from coder agent: {json.dumps(completion, indent=2)}")
+        logger.info("Completion from coder agent: %s", _LazyJSON(completion))
         
         # Step 6: Daytona agent deletes sandbox
         logger.info("Step 6: Daytona agent deletes sandbox")
-        deletion_result = self.daytona_agent.delete_sandbox(sandbox["id"])
+        deletion_result = next(pipeline)["result"]
         
-        logger.info(f"Deletion result: {json.dumps(deletion_result, indent=2)}")
+        logger.info("Deletion result: %s", _LazyJSON(deletion_result))
         
         logger.info("Workflow simulation completed")
 
@@ -1,105 +1,300 @@
 """A2A Integration for Daytona Sandbox Orchestration Agent."""
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Iterable, Optional, List, Tuple
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib
+import itertools
+import logging
 import os
 import sys
+import threading
+import time
 
-# Add A2A samples to path
+logger = logging.getLogger(__name__)
+
+# Default number of pooled A2A clients per integration instance. Multiple
+# clients let concurrent send_message calls use separate connections
+# instead of serializing on a single socket.
+CONN_POOL_MAX_SIZE = 4
+
+# Transport keep-alive settings passed to clients that support them
+# (httpx-style). The mock client ignores these.
+CLIENT_KEEPALIVE_OPTIONS = {
+    "http2": True,
+    "keepalive_time": 30,
+    "keepalive_timeout": 5,
+}
+
+# How long the background flusher waits before draining queued messages
+BATCH_INTERVAL_MS = 20
+
+# Maximum number of queued outbound messages before producers block
+OUTBOX_MAX_SIZE = 1000
+
+# How long a cached agent-discovery result stays fresh, in seconds
+AGENTS_CACHE_TTL = 60.0
+
+# How long a resolved AgentCard stays fresh, in seconds. Cards describe
+# mostly-static endpoints, so they live much longer than the routing
+# data in the discovery cache.
+CARD_CACHE_TTL = 300.0
+
+# Upper bound on threads used for a send_message_many fan-out
+FANOUT_MAX_WORKERS = 10
+
+def _derive_task_id(message: str) -> str:
+    """Derive a deterministic task ID from a message.
+
+    blake2b keeps the ID stable across processes (unlike hash(), which
+    is randomized per interpreter) so retries of the same message map to
+    the same task for idempotency.
+
+    Args:
+        message: The message to derive the ID from.
+
+    Returns:
+        The derived task ID.
+    """
+    digest = hashlib.blake2b(message.encode("utf-8"), digest_size=6).hexdigest()
+    return "task-" + digest
+
+# Location of the A2A samples checkout, resolved relative to this repo
 A2A_SAMPLES_PATH = os.path.abspath(os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
     "A2A", "samples", "python"
 ))
-sys.path.append(A2A_SAMPLES_PATH)
 
-# Import A2A client from samples
-try:
-    from common.client.client import A2AClient
-    from hosts.multiagent.remote_agent_connection import RemoteAgentConnections
-    
-    # Use the actual RemoteAgentConnections class
-    print("Successfully imported A2A clients")
+# Whether the real A2A client classes have been imported; flipped by
+# _load_a2a() on success
+USE_REAL_A2A = False
+
+@functools.lru_cache(maxsize=1)
+def _load_a2a() -> bool:
+    """Try to import the real A2A client classes, once per process.
+
+    Deferred from module import to first A2AIntegration construction so
+    that argparse --help, test collection and anything else that merely
+    imports this module doesn't pay the sys.path mutation or the sample
+    package import cost. On success the module-level A2AClient and
+    RemoteAgentConnections names are rebound to the real classes; on
+    failure the mock implementations below stay in place.
+
+    Returns:
+        True if the real A2A client classes were imported.
+    """
+    global A2AClient, RemoteAgentConnections, USE_REAL_A2A
+
+    # Probe for the concrete client module before registering anything:
+    # when the checkout is absent, sys.path stays untouched and every
+    # later import in the process avoids searching an extra directory
+    client_py = os.path.join(A2A_SAMPLES_PATH, "common", "client", "client.py")
+    if not os.path.isfile(client_py):
+        logger.warning("A2A samples not found at %s; using mock clients",
+                       A2A_SAMPLES_PATH)
+        return False
+
+    if A2A_SAMPLES_PATH not in sys.path:
+        sys.path.append(A2A_SAMPLES_PATH)
+
+    try:
+        client_mod = importlib.import_module("common.client.client")
+        conn_mod = importlib.import_module(
+            "hosts.multiagent.remote_agent_connection")
+    except ImportError as e:
+        logger.warning("Could not import A2A client: %s", e)
+        return False
+
+    logger.info("Successfully imported A2A clients")
+    A2AClient = client_mod.A2AClient
+    RemoteAgentConnections = conn_mod.RemoteAgentConnections
     USE_REAL_A2A = True
-except ImportError as e:
-    print(f"Warning: Could not import A2A client: {e}")
-    print(f"Using path: {A2A_SAMPLES_PATH}")
-    print(f"Contents: {os.listdir(A2A_SAMPLES_PATH) if os.path.exists(A2A_SAMPLES_PATH) else 'Path does not exist'}")
-    
-    # Fallback to mock implementation
-    USE_REAL_A2A = False
-    
-    class A2AClient:
-        """Mock A2A client for demonstration purposes."""
-        
-        def __init__(self, url: str):
-            """Initialize the A2A client.
-            
-            Args:
-                url: The URL of the A2A host.
-            """
-            self.url = url
-        
-        def list_agents(self) -> Dict[str, Any]:
-            """List available agents.
-            
-            Returns:
-                Dictionary of agent information.
-            """
-            # Mock implementation
-            return {
-                "agents": [
-                    {
-                        "id": "coder-agent",
-                        "name": "Coder Agent",
-                        "type": "development",
-                        "capabilities": ["code-generation", "code-review"]
-                    }
-                ]
-            }
-    
-    # We need to create our own mock for RemoteAgentConnections
-    class RemoteAgentConnections:
-        """Connection to a remote agent."""
-        
-        def __init__(self, agent_id: str, client: A2AClient):
-            """Initialize a remote agent connection.
-            
-            Args:
-                agent_id: The ID of the agent to connect to.
-                client: The A2A client to use for communication.
-            """
-            self.agent_id = agent_id
-            self.client = client
-        
-        def send_message(self, message: str, task_id: str) -> Dict[str, Any]:
-            """Send a message to the remote agent.
-            
-            Args:
-                message: The message to send.
-                task_id: The task ID to associate with the message.
-                
-            Returns:
-                The response from the agent.
-            """
-            # Mock implementation
-            return {
-                "status": "success",
-                "task_id": task_id,
-                "agent_id": self.agent_id,
-                "response": f"Received message: {message[:50]}...",
-                "timestamp": "2023-04-09T12:00:00Z"
-            }
+    return True
+
+# Mock implementations, used until _load_a2a() swaps in the real
+# classes (and kept when the samples checkout is absent)
+
+class A2AClient:
+    """Mock A2A client for demonstration purposes."""
+
+    def __init__(self, url: str, **transport_options: Any):
+        """Initialize the A2A client.
+
+        Args:
+            url: The URL of the A2A host.
+            **transport_options: Keep-alive/transport settings. The
+                real client maps these onto its HTTP/2 or gRPC channel
+                configuration; the mock only records them.
+        """
+        self.url = url
+        self.transport_options = transport_options
+
+    def list_agents(self) -> Dict[str, Any]:
+        """List available agents.
+
+        Returns:
+            Dictionary of agent information.
+        """
+        # Mock implementation
+        return {
+            "agents": [
+                {
+                    "id": "coder-agent",
+                    "name": "Coder Agent",
+                    "type": "development",
+                    "capabilities": ["code-generation", "code-review"]
+                }
+            ]
+        }
+
+# We need to create our own mock for RemoteAgentConnections
+class RemoteAgentConnections:
+    """Connection to a remote agent."""
+
+    def __init__(self, agent_id: str, client: A2AClient):
+        """Initialize a remote agent connection.
+
+        Args:
+            agent_id: The ID of the agent to connect to.
+            client: The A2A client to use for communication.
+        """
+        self.agent_id = agent_id
+        self.client = client
+
+    def send_message(self, message: str, task_id: str) -> Dict[str, Any]:
+        """Send a message to the remote agent.
+
+        Args:
+            message: The message to send.
+            task_id: The task ID to associate with the message.
+
+        Returns:
+            The response from the agent.
+        """
+        # Mock implementation
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "agent_id": self.agent_id,
+            "response": f"Received message: {message[:50]}...",
+            "timestamp": "2023-04-09T12:00:00Z"
+        }
+
+    def send_message_batch(self,
+                          messages: List[str],
+                          task_ids: List[str]) -> List[Dict[str, Any]]:
+        """Send several messages to the remote agent in one call.
+
+        Args:
+            messages: The messages to send.
+            task_ids: Task IDs associated with each message.
+
+        Returns:
+            One response per message, in order.
+        """
+        # Mock implementation
+        return [
+            self.send_message(message, task_id)
+            for message, task_id in zip(messages, task_ids)
+        ]
 
 class A2AIntegration:
     """Handles A2A protocol integration for the Daytona agent."""
-    
-    def __init__(self, host_url: str):
+
+    # Process-wide registry of shared integrations, keyed by host URL
+    _registry: Dict[str, "A2AIntegration"] = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def for_host(cls, host_url: str, **kwargs: Any) -> "A2AIntegration":
+        """Return the shared integration for a host, creating it once.
+
+        Agents talking to the same host share one integration (and its
+        connection pool) instead of opening a pool per agent instance.
+
+        Args:
+            host_url: The URL of the A2A host.
+            **kwargs: Arguments forwarded to the constructor on first use.
+
+        Returns:
+            The shared A2A integration for the host.
+        """
+        with cls._registry_lock:
+            instance = cls._registry.get(host_url)
+            if instance is None:
+                instance = cls(host_url, **kwargs)
+                cls._registry[host_url] = instance
+            return instance
+
+    def __init__(self,
+                host_url: str,
+                pool_size: int = CONN_POOL_MAX_SIZE,
+                client_options: Optional[Dict[str, Any]] = None):
         """Initialize the A2A integration.
-        
+
         Args:
             host_url: The URL of the A2A host.
+            pool_size: Number of pooled clients to keep open to the host.
+            client_options: Transport settings overriding the keep-alive
+                defaults, passed to clients that support them.
         """
-        self.client = A2AClient(host_url)
+        # Resolve the real A2A classes on first use (no-op afterwards)
+        _load_a2a()
+
+        self.host_url = host_url
+        self._client_options = dict(CLIENT_KEEPALIVE_OPTIONS)
+        if client_options:
+            self._client_options.update(client_options)
+        self._pool = [self._new_client(host_url) for _ in range(max(1, pool_size))]
+        self._rr = itertools.cycle(self._pool)
+        # Keep a default client for callers (and tests) that expect one
+        self.client = self._pool[0]
         self.connections = {}
-        
+        # Async outbox, created lazily on the first send_message_async call
+        self._outbox: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self.batch_interval_ms = BATCH_INTERVAL_MS
+        # Agent-discovery cache; the lock coalesces concurrent misses
+        # into a single upstream call
+        self._agents_cache: Optional[Dict[str, Any]] = None
+        self._agents_cache_expiry = 0.0
+        self._agents_ttl = AGENTS_CACHE_TTL
+        self._agents_lock = threading.Lock()
+        self._agents_refreshing = False
+        # Resolved AgentCards, kept separately from discovery results
+        # because card metadata is far less volatile than routing data
+        self._card_cache: Dict[str, Any] = {}
+        self._card_ttl_default = CARD_CACHE_TTL
+        # Direct dispatch for agents co-located in this process
+        self._local_handlers: Dict[str, Callable[[str, str], Dict[str, Any]]] = {}
+
+    def _new_client(self, host_url: str) -> A2AClient:
+        """Create a pooled A2A client with keep-alive when supported.
+
+        Args:
+            host_url: The URL of the A2A host.
+
+        Returns:
+            A new A2A client instance.
+        """
+        try:
+            return A2AClient(host_url, **self._client_options)
+        except TypeError:
+            # Client does not accept transport options
+            return A2AClient(host_url)
+
+    def close(self) -> None:
+        """Close all pooled clients and drop active connections."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        for client in self._pool:
+            close = getattr(client, "close", None)
+            if close:
+                close()
+        self.connections.clear()
+
     def connect_to_agent(self, agent_id: str) -> RemoteAgentConnections:
         """Establish connection to another agent.
         
@@ -110,30 +305,108 @@ class A2AIntegration:
             The established connection.
         """
         if USE_REAL_A2A:
-            # TODO: This is a placeholder. We need a proper implementation
-            # that converts agent_id to AgentCard for RemoteAgentConnections
-            from common.types import AgentCard, AgentProvider, AgentCapabilities, AgentAuthentication, AgentSkill
-            
-            # Create a mock AgentCard based on agent_id
-            agent_card = AgentCard(
-                name=f"Agent {agent_id}",
-                url=f"http://localhost:8080/agents/{agent_id}",
-                version="1.0.0",
-                provider=AgentProvider(organization="Example Org"),
-                capabilities=AgentCapabilities(streaming=False),
-                authentication=AgentAuthentication(schemes=["none"]),
-                skills=[AgentSkill(id="skill1", name="Skill 1")]
-            )
-            
-            # Create a real RemoteAgentConnections instance
-            connection = RemoteAgentConnections(agent_card)
+            # Create a real RemoteAgentConnections instance, reusing a
+            # cached card when one is still fresh
+            connection = RemoteAgentConnections(self._resolve_card(agent_id))
         else:
-            # Use our mock implementation
-            connection = RemoteAgentConnections(agent_id, self.client)
+            # Use our mock implementation, bound to the next pooled client
+            connection = RemoteAgentConnections(agent_id, next(self._rr))
             
         self.connections[agent_id] = connection
+        # Topology changed; let the next discovery call refetch
+        self.invalidate_agents_cache()
         return connection
-        
+
+    def _resolve_card(self, agent_id: str) -> Any:
+        """Return the AgentCard for an agent, resolving at most once per TTL.
+
+        Cards are rebuilt (and eventually fetched) only after their
+        cached copy expires; a card carrying its own ttl field overrides
+        the default window.
+
+        Args:
+            agent_id: The ID of the agent.
+
+        Returns:
+            The agent's card.
+        """
+        cached = self._card_cache.get(agent_id)
+        if cached is not None:
+            card, expiry = cached
+            if time.monotonic() < expiry:
+                return card
+
+        # TODO: This is a placeholder. We need a proper implementation
+        # that fetches the AgentCard from the host
+        from common.types import AgentCard, AgentProvider, AgentCapabilities, AgentAuthentication, AgentSkill
+
+        card = AgentCard(
+            name=f"Agent {agent_id}",
+            url=f"http://localhost:8080/agents/{agent_id}",
+            version="1.0.0",
+            provider=AgentProvider(organization="Example Org"),
+            capabilities=AgentCapabilities(streaming=False),
+            authentication=AgentAuthentication(schemes=["none"]),
+            skills=[AgentSkill(id="skill1", name="Skill 1")]
+        )
+        ttl = getattr(card, "ttl", None) or self._card_ttl_default
+        self._card_cache[agent_id] = (card, time.monotonic() + ttl)
+        return card
+
+    def invalidate_card(self, agent_id: str) -> None:
+        """Drop the cached card for an agent.
+
+        Call this after auth or not-found responses (401/403/404) so the
+        next connect re-resolves instead of reusing stale metadata.
+
+        Args:
+            agent_id: The ID of the agent.
+        """
+        self._card_cache.pop(agent_id, None)
+
+    def warmup(self, agent_ids: Iterable[str]) -> None:
+        """Establish connections to the given agents up front.
+
+        Connection setup (TCP+TLS and card fetch in the real path)
+        happens concurrently here instead of inline on the first
+        send_message per peer. Already-connected agents are skipped.
+
+        Args:
+            agent_ids: IDs of the agents to connect to.
+        """
+        pending = [
+            agent_id for agent_id in agent_ids
+            if agent_id not in self.connections
+        ]
+        if not pending:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            list(executor.map(self.connect_to_agent, pending))
+
+    def register_local_agent(self,
+                            agent_id: str,
+                            handler: Callable[[str, str], Dict[str, Any]]) -> None:
+        """Register an in-process handler for an agent ID.
+
+        Messages sent to a registered agent are dispatched to the handler
+        directly instead of going through the A2A transport.
+
+        Args:
+            agent_id: The ID of the co-located agent.
+            handler: Callable taking (message, task_id) and returning the
+                agent's response.
+        """
+        self._local_handlers[agent_id] = handler
+
+    def unregister_local_agent(self, agent_id: str) -> None:
+        """Remove an in-process handler for an agent ID.
+
+        Args:
+            agent_id: The ID of the agent to remove.
+        """
+        self._local_handlers.pop(agent_id, None)
+
     def disconnect_from_agent(self, agent_id: str) -> None:
         """Disconnect from an agent.
         
@@ -143,6 +416,8 @@ class A2AIntegration:
         if agent_id in self.connections:
             # Close connection if needed
             del self.connections[agent_id]
+            # Topology changed; let the next discovery call refetch
+            self.invalidate_agents_cache()
     
     def send_message(self, 
                     agent_id: str, 
@@ -158,23 +433,215 @@ class A2AIntegration:
         Returns:
             Response from the agent.
         """
+        # Fast path: agents in this process are called directly, skipping
+        # HTTP framing and JSON-RPC entirely
+        handler = self._local_handlers.get(agent_id)
+        if handler is not None:
+            return handler(message, task_id or _derive_task_id(message))
+
         if agent_id not in self.connections:
             connection = self.connect_to_agent(agent_id)
         else:
             connection = self.connections[agent_id]
-            
+
         # Create task if task_id not provided
         if not task_id:
-            task_id = "task-" + str(hash(message))[:8]
-            
+            task_id = _derive_task_id(message)
+
+
         # Send message using A2A connection
         response = connection.send_message(message, task_id)
         return response
-    
+
+    def send_message_many(self,
+                         targets: List[Tuple[str, str, Optional[str]]],
+                         max_workers: int = FANOUT_MAX_WORKERS) -> List[Dict[str, Any]]:
+        """Send messages to several agents in parallel.
+
+        Dispatches via a thread pool so wall-clock latency is the
+        slowest single round-trip rather than their sum. Connections
+        for new agents are established inside worker threads; the
+        connections dict is only mutated under the CPython GIL, but
+        callers juggling their own threads should warmup() first.
+
+        Args:
+            targets: (agent_id, message, task_id) tuples; task_id may
+                be None to derive one from the message.
+            max_workers: Maximum number of concurrent sends.
+
+        Returns:
+            One response per target, in order.
+        """
+        if not targets:
+            return []
+
+        workers = min(max_workers, len(targets))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda t: self.send_message(*t), targets))
+
+    async def send_message_many_async(self,
+                                     targets: List[Tuple[str, str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Send messages to several agents concurrently from a coroutine.
+
+        Args:
+            targets: (agent_id, message, task_id) tuples; task_id may
+                be None to derive one from the message.
+
+        Returns:
+            One response per target, in order.
+        """
+        return await asyncio.gather(
+            *(self.send_message_async(agent_id, message, task_id)
+              for agent_id, message, task_id in targets)
+        )
+
+    async def send_message_async(self,
+                                agent_id: str,
+                                message: str,
+                                task_id: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a message for batched delivery to another agent.
+
+        Messages queued within the same batch interval and destined for the
+        same agent are sent in a single batched call, so a fan-out of many
+        small messages costs one round-trip per agent instead of one per
+        message.
+
+        Args:
+            agent_id: The ID of the agent to send the message to.
+            message: The message content.
+            task_id: Optional task ID to associate with this message.
+
+        Returns:
+            Response from the agent.
+        """
+        self._ensure_flusher()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._outbox.put((agent_id, message, task_id, future))
+        return await future
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher task if it isn't running yet."""
+        if self._outbox is None:
+            self._outbox = asyncio.Queue(maxsize=OUTBOX_MAX_SIZE)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(
+                self._flush_loop()
+            )
+
+    async def _flush_loop(self) -> None:
+        """Periodically drain the outbox, batching messages per agent."""
+        while True:
+            await asyncio.sleep(self.batch_interval_ms / 1000)
+            batches: Dict[str, List[tuple]] = {}
+            while True:
+                try:
+                    item = self._outbox.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                batches.setdefault(item[0], []).append(item)
+
+            for agent_id, items in batches.items():
+                # _send_batch resolves its futures on failure; guard
+                # anyway so one agent's batch blowing up can't abort the
+                # other batches in this drain cycle or kill the flusher
+                try:
+                    self._send_batch(agent_id, items)
+                except Exception as e:
+                    for item in items:
+                        if not item[3].done():
+                            item[3].set_exception(e)
+
+    def _send_batch(self, agent_id: str, items: List[tuple]) -> None:
+        """Send one batch of queued messages to a single agent.
+
+        Args:
+            agent_id: The ID of the destination agent.
+            items: Queued (agent_id, message, task_id, future) tuples.
+        """
+        messages = [item[1] for item in items]
+        task_ids = [item[2] or _derive_task_id(item[1]) for item in items]
+
+        try:
+            # Connect inside the try: a connection failure must reject
+            # the batch's futures, not propagate into the flusher loop
+            # and leave every awaiting caller hanging
+            if agent_id not in self.connections:
+                connection = self.connect_to_agent(agent_id)
+            else:
+                connection = self.connections[agent_id]
+
+            batch_send = getattr(connection, "send_message_batch", None)
+            if batch_send:
+                responses = batch_send(messages, task_ids)
+            else:
+                # Connection has no batch support; fall back to per-message
+                responses = [
+                    connection.send_message(message, task_id)
+                    for message, task_id in zip(messages, task_ids)
+                ]
+            for item, response in zip(items, responses):
+                if not item[3].done():
+                    item[3].set_result(response)
+        except Exception as e:
+            for item in items:
+                if not item[3].done():
+                    item[3].set_exception(e)
+
     def list_available_agents(self) -> Dict[str, Any]:
         """List all available agents on the A2A network.
-        
+
+        Results are cached for a short TTL since the agent list is stable
+        on the order of seconds-to-minutes while discovery is a network
+        round-trip in the real A2A path. After the TTL lapses the stale
+        list is still returned immediately while a background thread
+        revalidates, so callers on the hot path never block on
+        discovery; only the very first call (no data at all) fetches
+        inline.
+
         Returns:
             Dictionary of agent information.
         """
-        return self.client.list_agents()
\ No newline at end of file
+        if self._agents_cache is not None:
+            if time.monotonic() >= self._agents_cache_expiry:
+                self._refresh_agents_async()
+            return self._agents_cache
+
+        with self._agents_lock:
+            # Re-check inside the lock: another caller may have refreshed
+            now = time.monotonic()
+            if self._agents_cache is not None and now < self._agents_cache_expiry:
+                return self._agents_cache
+
+            agents = self.client.list_agents()
+            self._agents_cache = agents
+            self._agents_cache_expiry = now + self._agents_ttl
+            return agents
+
+    def _refresh_agents_async(self) -> None:
+        """Revalidate the agent list in the background, at most once at a time."""
+        if self._agents_refreshing:
+            return
+        with self._agents_lock:
+            if self._agents_refreshing:
+                return
+            self._agents_refreshing = True
+
+        def _refresh() -> None:
+            try:
+                agents = self.client.list_agents()
+                with self._agents_lock:
+                    self._agents_cache = agents
+                    self._agents_cache_expiry = time.monotonic() + self._agents_ttl
+            except Exception as e:
+                # Keep serving the stale list; the next expiry retries
+                logger.warning("Agent discovery refresh failed: %s", e)
+            finally:
+                self._agents_refreshing = False
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    def invalidate_agents_cache(self) -> None:
+        """Drop the cached agent list so the next call refetches it."""
+        with self._agents_lock:
+            self._agents_cache = None
+            self._agents_cache_expiry = 0.0
\ No newline at end of file
@@ -1,16 +1,32 @@
 """Daytona Sandbox Orchestration Agent implementation."""
-from typing import Any, Dict, List, Optional
+import itertools
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
 
+# Monotonic sandbox-ID source shared by all agents: unlike deriving IDs
+# from len(_sandbox_state), the counter never reissues an ID after a
+# delete. Module-level (not a class attribute) so pydantic doesn't turn
+# it into a per-instance private attr; the lock keeps next() atomic
+# across threads.
+_SANDBOX_ID_COUNTER = itertools.count(1)
+_SANDBOX_ID_LOCK = threading.Lock()
+
 class DaytonaSandboxAgent(LlmAgent):
     """Agent for orchestrating Daytona sandbox environments."""
     
     # Using class variables for tools
     _sandbox_state: Dict[str, Dict[str, Any]] = {}
+    # Secondary indices over _sandbox_state, maintained on every
+    # create/configure/delete so filtered listings are set lookups
+    # instead of full scans
+    _by_status: Dict[str, Set[str]] = {}
+    _by_template: Dict[str, Set[str]] = {}
     _a2a_client = None
-    
+
+
     def __init__(self, name: str = "daytona_sandbox_agent", **kwargs: Any):
         """Initialize the Daytona Sandbox Agent.
         
@@ -18,20 +34,20 @@ class DaytonaSandboxAgent(LlmAgent):
             name: The name of the agent.
             **kwargs: Additional arguments to pass to the parent class.
         """
-        # Create function tools
+        # Build the sandbox tools as one list and hand them to the
+        # parent in a single pass rather than registering one at a time
         sandbox_tools = [
-            FunctionTool(self.create_sandbox),
-            FunctionTool(self.configure_sandbox),
-            FunctionTool(self.delete_sandbox),
-            FunctionTool(self.list_sandboxes)
+            FunctionTool(method)
+            for method in (
+                self.create_sandbox,
+                self.configure_sandbox,
+                self.delete_sandbox,
+                self.list_sandboxes,
+            )
         ]
-        
-        # Add tools to kwargs
-        if "tools" in kwargs:
-            kwargs["tools"] = kwargs["tools"] + sandbox_tools
-        else:
-            kwargs["tools"] = sandbox_tools
-            
+
+        kwargs["tools"] = kwargs.get("tools", []) + sandbox_tools
+
         super().__init__(name=name, **kwargs)
     
     def create_sandbox(self, 
@@ -49,7 +65,8 @@ class DaytonaSandboxAgent(LlmAgent):
             Dict containing the sandbox details.
         """
         # TODO: Implement actual Daytona API calls
-        sandbox_id = f"sandbox-{len(self._sandbox_state) + 1}"
+        with _SANDBOX_ID_LOCK:
+            sandbox_id = f"sandbox-{next(_SANDBOX_ID_COUNTER)}"
         
         sandbox_details = {
             "id": sandbox_id,
@@ -61,6 +78,8 @@ class DaytonaSandboxAgent(LlmAgent):
         }
         
         self._sandbox_state[sandbox_id] = sandbox_details
+        self._by_status.setdefault("creating", set()).add(sandbox_id)
+        self._by_template.setdefault(template, set()).add(sandbox_id)
         return sandbox_details
     
     def configure_sandbox(self, 
@@ -77,14 +96,19 @@ class DaytonaSandboxAgent(LlmAgent):
         """
         if sandbox_id not in self._sandbox_state:
             raise ValueError(f"Sandbox {sandbox_id} not found")
-        
+
+        sandbox = self._sandbox_state[sandbox_id]
+        old_status = sandbox["status"]
+        old_template = sandbox["template"]
+
         # Apply configuration
         for key, value in configuration.items():
-            if key in self._sandbox_state[sandbox_id]:
-                self._sandbox_state[sandbox_id][key] = value
-        
-        self._sandbox_state[sandbox_id]["status"] = "configured"
-        return self._sandbox_state[sandbox_id]
+            if key in sandbox:
+                sandbox[key] = value
+
+        sandbox["status"] = "configured"
+        self._reindex(sandbox_id, old_status, old_template, sandbox)
+        return sandbox
     
     def delete_sandbox(self, sandbox_id: str) -> Dict[str, str]:
         """Delete a sandbox environment.
@@ -99,14 +123,104 @@ class DaytonaSandboxAgent(LlmAgent):
             raise ValueError(f"Sandbox {sandbox_id} not found")
             
         # TODO: Implement actual Daytona API calls
-        del self._sandbox_state[sandbox_id]
-        
+        sandbox = self._sandbox_state.pop(sandbox_id)
+        self._by_status.get(sandbox["status"], set()).discard(sandbox_id)
+        self._by_template.get(sandbox["template"], set()).discard(sandbox_id)
+
         return {"status": "success", "message": f"Sandbox {sandbox_id} deleted"}
-    
-    def list_sandboxes(self) -> List[Dict[str, Any]]:
-        """List all sandboxes managed by this agent.
-        
+
+    def _reindex(self,
+                 sandbox_id: str,
+                 old_status: str,
+                 old_template: str,
+                 sandbox: Dict[str, Any]) -> None:
+        """Move a sandbox between index sets after its fields changed.
+
+        Args:
+            sandbox_id: The ID of the sandbox.
+            old_status: Status before the change.
+            old_template: Template before the change.
+            sandbox: The sandbox details after the change.
+        """
+        if sandbox["status"] != old_status:
+            self._by_status.get(old_status, set()).discard(sandbox_id)
+            self._by_status.setdefault(sandbox["status"], set()).add(sandbox_id)
+        if sandbox["template"] != old_template:
+            self._by_template.get(old_template, set()).discard(sandbox_id)
+            self._by_template.setdefault(sandbox["template"], set()).add(sandbox_id)
+
+    def list_sandboxes(self,
+                       status: Optional[str] = None,
+                       template: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List sandboxes managed by this agent, optionally filtered.
+
+        Filtered queries resolve through the secondary indices, so they
+        touch only the matching sandboxes rather than scanning all of
+        them.
+
+        Args:
+            status: Only return sandboxes with this status.
+            template: Only return sandboxes built from this template.
+
         Returns:
             List of sandbox details.
         """
-        return list(self._sandbox_state.values())
\ No newline at end of file
+        if status is None and template is None:
+            return list(self._sandbox_state.values())
+
+        if status is not None:
+            ids = set(self._by_status.get(status, set()))
+            if template is not None:
+                ids &= self._by_template.get(template, set())
+        else:
+            ids = set(self._by_template.get(template, set()))
+
+        return [self._sandbox_state[sandbox_id] for sandbox_id in sorted(ids)]
+
+    def run_pipeline(self, steps: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Run a sequence of sandbox operations as one pipeline.
+
+        Results stream back as each step completes, so callers can react
+        to early steps (e.g. a created sandbox) while later steps are
+        still pending instead of waiting on the whole batch. Steps that
+        omit "sandbox_id" operate on the sandbox created most recently
+        within the same pipeline.
+
+        Args:
+            steps: Operations to run, each a dict with a "type" of
+                create_sandbox, configure_sandbox, delete_sandbox or
+                list_sandboxes plus that operation's arguments.
+
+        Yields:
+            Dicts with the step "type" and its "result", in step order.
+
+        Raises:
+            ValueError: If a step has an unknown type.
+        """
+        last_created: Optional[str] = None
+
+        for step in steps:
+            step_type = step.get("type")
+
+            if step_type == "create_sandbox":
+                result = self.create_sandbox(
+                    name=step["name"],
+                    template=step["template"],
+                    resources=step.get("resources")
+                )
+                last_created = result["id"]
+            elif step_type == "configure_sandbox":
+                result = self.configure_sandbox(
+                    sandbox_id=step.get("sandbox_id") or last_created,
+                    configuration=step["configuration"]
+                )
+            elif step_type == "delete_sandbox":
+                result = self.delete_sandbox(
+                    sandbox_id=step.get("sandbox_id") or last_created
+                )
+            elif step_type == "list_sandboxes":
+                result = self.list_sandboxes()
+            else:
+                raise ValueError(f"Unknown pipeline step type: {step_type}")
+
+            yield {"type": step_type, "result": result}
\ No newline at end of file
@@ -1,25 +1,77 @@
 """Tools for the Daytona Sandbox Orchestration Agent."""
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
-import requests
+import uuid
+import httpx
 from google.adk.tools import FunctionTool
 
+# Sandbox collection path under the API base URL, resolved once so
+# per-call URLs are a single concatenation against the client base_url
+SANDBOXES_PATH = "/sandboxes"
+
+# Matches AGENT_CONFIG["version"] in src/config.py; duplicated here so
+# the module works under both the `agent.*` and `src.agent.*` import
+# paths
+USER_AGENT = "dagent/0.1.0"
+
+# Connection-pool limits for the shared Daytona API client
+POOL_MAX_CONNECTIONS = 20
+POOL_MAX_KEEPALIVE = 10
+
+# Matches DAYTONA_API_CONFIG["default_timeout"] in src/config.py;
+# duplicated here so the module works under both the `agent.*` and
+# `src.agent.*` import paths
+DEFAULT_TIMEOUT = 60.0
+
 class DaytonaToolset:
     """A collection of tools for interacting with Daytona sandboxes."""
-    
+
     def __init__(self, api_url: str, api_key: Optional[str] = None):
         """Initialize the Daytona toolset.
-        
+
         Args:
             api_url: The URL of the Daytona API.
             api_key: Optional API key for authentication.
         """
         self.api_url = api_url
         self.api_key = api_key
-        self.headers = {}
-        
+
+        # Materialize the full header set once and freeze it: the
+        # client copies it a single time at construction, so no per-call
+        # header dict is built, and callers can't mutate it by accident
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": USER_AGENT,
+        }
         if api_key:
-            self.headers["Authorization"] = f"Bearer {api_key}"
-    
+            headers["Authorization"] = f"Bearer {api_key}"
+        self.headers = MappingProxyType(headers)
+
+        # One pooled async client for all API calls: connections are
+        # kept alive and reused instead of handshaking per request, and
+        # awaiting the calls lets the ADK overlap parallel tool
+        # invocations within a single LLM turn
+        self._client = httpx.AsyncClient(
+            base_url=api_url,
+            headers=dict(self.headers),
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        )
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "DaytonaToolset":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
     def as_tools(self) -> List[FunctionTool]:
         """Convert the toolset to a list of FunctionTool objects.
         
@@ -36,10 +88,10 @@ class DaytonaToolset:
             FunctionTool(self.stop_sandbox),
         ]
     
-    def create_sandbox(self, 
-                      name: str, 
-                      template: str, 
-                      resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def create_sandbox(self,
+                            name: str,
+                            template: str,
+                            resources: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create a new Daytona sandbox.
         
         Args:
@@ -58,19 +110,19 @@ class DaytonaToolset:
         }
         
         # Simulate API call
-        # response = requests.post(f"{self.api_url}/sandboxes", json=payload, headers=self.headers)
+        # response = await self._client.post(SANDBOXES_PATH, json=payload)
         # return response.json()
         
         # Mock response for now
         return {
-            "id": f"sandbox-{hash(name)}",
+            "id": f"sandbox-{uuid.uuid4().hex[:12]}",
             "name": name,
             "template": template,
             "status": "creating",
             "resources": resources or {},
         }
     
-    def get_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
+    async def get_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
         """Get details of a specific sandbox.
         
         Args:
@@ -80,7 +132,7 @@ class DaytonaToolset:
             Sandbox details.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.get(f"{self.api_url}/sandboxes/{sandbox_id}", headers=self.headers)
+        # response = await self._client.get(f"{SANDBOXES_PATH}/{sandbox_id}")
         # return response.json()
         
         # Mock response for now
@@ -91,14 +143,14 @@ class DaytonaToolset:
             "url": f"https://{sandbox_id}.example.com",
         }
     
-    def list_sandboxes(self) -> List[Dict[str, Any]]:
+    async def list_sandboxes(self) -> List[Dict[str, Any]]:
         """List all sandboxes.
         
         Returns:
             List of sandbox details.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.get(f"{self.api_url}/sandboxes", headers=self.headers)
+        # response = await self._client.get(SANDBOXES_PATH)
         # return response.json()
         
         # Mock response for now
@@ -115,7 +167,7 @@ class DaytonaToolset:
             }
         ]
     
-    def delete_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
+    async def delete_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
         """Delete a sandbox.
         
         Args:
@@ -125,7 +177,7 @@ class DaytonaToolset:
             Status message.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.delete(f"{self.api_url}/sandboxes/{sandbox_id}", headers=self.headers)
+        # response = await self._client.delete(f"{SANDBOXES_PATH}/{sandbox_id}")
         # return response.json()
         
         # Mock response for now
@@ -134,9 +186,9 @@ class DaytonaToolset:
             "message": f"Sandbox {sandbox_id} deleted",
         }
     
-    def configure_sandbox(self, 
-                         sandbox_id: str, 
-                         configuration: Dict[str, Any]) -> Dict[str, Any]:
+    async def configure_sandbox(self,
+                               sandbox_id: str,
+                               configuration: Dict[str, Any]) -> Dict[str, Any]:
         """Configure an existing sandbox.
         
         Args:
@@ -147,10 +199,9 @@ class DaytonaToolset:
             Updated sandbox details.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.patch(
-        #     f"{self.api_url}/sandboxes/{sandbox_id}", 
-        #     json=configuration, 
-        #     headers=self.headers
+        # response = await self._client.patch(
+        #     f"{SANDBOXES_PATH}/{sandbox_id}",
+        #     json=configuration,
         # )
         # return response.json()
         
@@ -161,7 +212,7 @@ class DaytonaToolset:
             "configuration": configuration,
         }
     
-    def start_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
+    async def start_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
         """Start a sandbox.
         
         Args:
@@ -171,10 +222,7 @@ class DaytonaToolset:
             Status message.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.post(
-        #     f"{self.api_url}/sandboxes/{sandbox_id}/start", 
-        #     headers=self.headers
-        # )
+        # response = await self._client.post(f"{SANDBOXES_PATH}/{sandbox_id}/start")
         # return response.json()
         
         # Mock response for now
@@ -184,7 +232,7 @@ class DaytonaToolset:
             "message": f"Sandbox {sandbox_id} started",
         }
     
-    def stop_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
+    async def stop_sandbox(self, sandbox_id: str) -> Dict[str, Any]:
         """Stop a sandbox.
         
         Args:
@@ -194,10 +242,7 @@ class DaytonaToolset:
             Status message.
         """
         # TODO: Replace with actual Daytona API implementation
-        # response = requests.post(
-        #     f"{self.api_url}/sandboxes/{sandbox_id}/stop", 
-        #     headers=self.headers
-        # )
+        # response = await self._client.post(f"{SANDBOXES_PATH}/{sandbox_id}/stop")
         # return response.json()
         
         # Mock response for now
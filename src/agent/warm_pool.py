@@ -0,0 +1,124 @@
+"""Warm sandbox pool for the Daytona Sandbox Orchestration Agent."""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import itertools
+import threading
+
+# Default number of warm sandboxes kept per (template, size) key
+DEFAULT_POOL_SIZE_PER_KEY = 1
+
+class WarmPool:
+    """Keeps pre-created sandboxes ready to satisfy create requests.
+
+    Creating a sandbox pays full cold-start cost (image pull + runtime
+    init). The pool pre-creates a few sandboxes per (template_id,
+    resource_size) key so a create request can claim an idle warm
+    instance — a cheap rename — and the pool replenishes itself in the
+    background.
+    """
+
+    _warm_counter = itertools.count(1)
+
+    def __init__(self,
+                create_sandbox: Callable[..., Dict[str, Any]],
+                resources_for: Callable[[str], Dict[str, Any]],
+                templates: Iterable[str],
+                sizes: Iterable[str],
+                per_key: int = DEFAULT_POOL_SIZE_PER_KEY):
+        """Initialize the warm pool and pre-create its sandboxes.
+
+        Args:
+            create_sandbox: Callable used to create a sandbox, with the
+                same signature as DaytonaSandboxAgent.create_sandbox.
+            resources_for: Callable mapping a resource size to a resource
+                configuration.
+            templates: Template IDs to keep warm sandboxes for.
+            sizes: Resource sizes to keep warm sandboxes for.
+            per_key: Number of warm sandboxes per (template, size) key.
+        """
+        self._create_sandbox = create_sandbox
+        self._resources_for = resources_for
+        self._per_key = per_key
+        self._lock = threading.Lock()
+        self._warm: Dict[Tuple[str, str], List[Dict[str, Any]]] = {
+            (template, size): []
+            for template in templates
+            for size in sizes
+        }
+        self.fill()
+
+    def fill(self) -> None:
+        """Pre-create warm sandboxes for every configured key."""
+        with self._lock:
+            for key, bucket in self._warm.items():
+                while len(bucket) < self._per_key:
+                    bucket.append(self._create_warm(key))
+
+    def acquire(self,
+               template_id: str,
+               resource_size: str,
+               name: str) -> Optional[Dict[str, Any]]:
+        """Claim a warm sandbox for the given template and size.
+
+        Args:
+            template_id: The template the sandbox was created from.
+            resource_size: The resource size of the sandbox.
+            name: The name to give the claimed sandbox.
+
+        Returns:
+            The claimed sandbox details, or None on a pool miss.
+        """
+        with self._lock:
+            bucket = self._warm.get((template_id, resource_size))
+            if not bucket:
+                return None
+            sandbox = bucket.pop()
+
+        # Claiming is a rename, not a new create
+        sandbox["name"] = name
+        sandbox["state"] = "claimed"
+        return sandbox
+
+    def replenish_async(self, template_id: str, resource_size: str) -> None:
+        """Refill the pool for one key in a background thread.
+
+        Args:
+            template_id: The template to replenish.
+            resource_size: The resource size to replenish.
+        """
+        thread = threading.Thread(
+            target=self._replenish,
+            args=((template_id, resource_size),),
+            daemon=True
+        )
+        thread.start()
+
+    def _replenish(self, key: Tuple[str, str]) -> None:
+        """Create warm sandboxes until the key is back at capacity.
+
+        Args:
+            key: The (template_id, resource_size) key to refill.
+        """
+        with self._lock:
+            bucket = self._warm.get(key)
+            if bucket is None:
+                return
+            while len(bucket) < self._per_key:
+                bucket.append(self._create_warm(key))
+
+    def _create_warm(self, key: Tuple[str, str]) -> Dict[str, Any]:
+        """Create one warm sandbox for the given key.
+
+        Args:
+            key: The (template_id, resource_size) key to create for.
+
+        Returns:
+            The created sandbox details, tagged as warm.
+        """
+        template_id, resource_size = key
+        sandbox = self._create_sandbox(
+            name=f"warm-{template_id}-{resource_size}-{next(self._warm_counter)}",
+            template=template_id,
+            resources=dict(self._resources_for(resource_size))
+        )
+        sandbox["state"] = "warm"
+        return sandbox
@@ -1,57 +1,79 @@
 """Configuration for the Daytona Sandbox Orchestration Agent."""
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-# Default sandbox templates
+# Default sandbox templates. Each entry is frozen in a MappingProxyType
+# (with tuple-valued lists) so the getters can hand out the shared
+# object directly: callers can't corrupt the config by mutating a
+# returned template, and no per-read copy is needed. Use dict(template)
+# for a mutable copy.
 DEFAULT_TEMPLATES = [
-    {
+    MappingProxyType({
         "id": "python-dev",
         "name": "Python Development Environment",
         "description": "Environment for Python development with common tools and libraries",
         "base_image": "python:3.9",
-        "installed_packages": ["pytest", "black", "isort", "mypy", "flake8"],
-        "setup_commands": [
+        "installed_packages": ("pytest", "black", "isort", "mypy", "flake8"),
+        "setup_commands": (
             "pip install -r requirements.txt",
-        ],
-    },
-    {
+        ),
+    }),
+    MappingProxyType({
         "id": "node-dev",
         "name": "Node.js Development Environment",
         "description": "Environment for Node.js development with common tools and libraries",
         "base_image": "node:16",
-        "installed_packages": ["typescript", "eslint", "prettier", "jest"],
-        "setup_commands": [
+        "installed_packages": ("typescript", "eslint", "prettier", "jest"),
+        "setup_commands": (
             "npm install",
-        ],
-    },
-    {
+        ),
+    }),
+    MappingProxyType({
         "id": "go-dev",
         "name": "Go Development Environment",
         "description": "Environment for Go development with common tools and libraries",
         "base_image": "golang:1.18",
-        "installed_packages": [],
-        "setup_commands": [
+        "installed_packages": (),
+        "setup_commands": (
             "go mod download",
-        ],
-    },
+        ),
+    }),
 ]
 
-# Default resource configurations
+# Index over DEFAULT_TEMPLATES, built once at import so lookups are O(1)
+_TEMPLATES_BY_ID: Dict[str, Dict[str, Any]] = {
+    template["id"]: template for template in DEFAULT_TEMPLATES
+}
+
+def rebuild_template_index() -> None:
+    """Rebuild the template index after mutating DEFAULT_TEMPLATES."""
+    _TEMPLATES_BY_ID.clear()
+    _TEMPLATES_BY_ID.update(
+        {template["id"]: template for template in DEFAULT_TEMPLATES}
+    )
+    get_template_by_id.cache_clear()
+
+# Default resource configurations, frozen like the templates above
 DEFAULT_RESOURCE_CONFIGS = {
-    "small": {
-        "cpu": "1",
-        "memory": "2Gi",
-        "disk": "10Gi",
-    },
-    "medium": {
-        "cpu": "2",
-        "memory": "4Gi",
-        "disk": "20Gi",
-    },
-    "large": {
-        "cpu": "4",
-        "memory": "8Gi",
-        "disk": "40Gi",
-    },
+    size: MappingProxyType(config)
+    for size, config in {
+        "small": {
+            "cpu": "1",
+            "memory": "2Gi",
+            "disk": "10Gi",
+        },
+        "medium": {
+            "cpu": "2",
+            "memory": "4Gi",
+            "disk": "20Gi",
+        },
+        "large": {
+            "cpu": "4",
+            "memory": "8Gi",
+            "disk": "40Gi",
+        },
+    }.items()
 }
 
 # Agent configurations
@@ -78,32 +100,40 @@ DAYTONA_API_CONFIG = {
     "default_timeout": 60,  # seconds
 }
 
+@lru_cache(maxsize=64)
 def get_template_by_id(template_id: str) -> Dict[str, Any]:
     """Get a template by ID.
-    
+
+    Results are cached; call get_template_by_id.cache_clear() after
+    changing DEFAULT_TEMPLATES at runtime.
+
     Args:
         template_id: The ID of the template.
-        
+
     Returns:
         The template configuration.
-        
+
     Raises:
         ValueError: If the template does not exist.
     """
-    for template in DEFAULT_TEMPLATES:
-        if template["id"] == template_id:
-            return template
-    raise ValueError(f"Template with ID '{template_id}' not found")
+    try:
+        return _TEMPLATES_BY_ID[template_id]
+    except KeyError:
+        raise ValueError(f"Template with ID '{template_id}' not found")
 
+@lru_cache(maxsize=64)
 def get_resource_config(size: str) -> Dict[str, str]:
     """Get a resource configuration by size.
-    
+
+    Results are cached; call get_resource_config.cache_clear() after
+    changing DEFAULT_RESOURCE_CONFIGS at runtime.
+
     Args:
         size: The size of the resource configuration.
-        
+
     Returns:
         The resource configuration.
-        
+
     Raises:
         ValueError: If the resource configuration does not exist.
     """
@@ -1,69 +1,122 @@
 """Main application for Daytona Sandbox Orchestration Agent."""
 import argparse
+import functools
 import logging
 import os
-import dotenv
+import signal
+import sys
+import threading
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
-from google.adk.models import Gemini
-from google.adk.tools import FunctionTool
-from agent.daytona_agent import DaytonaSandboxAgent
-from agent.a2a_integration import A2AIntegration
+# The google.adk and agent.* imports are deliberately deferred into
+# create_agent: they pull in the LLM SDK and its transitive
+# dependencies, which dominate interpreter startup and aren't needed
+# for --help or argument errors
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-dotenv.load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _communication_tools() -> tuple:
+    """Build the communication tool wrappers, once per process.
+
+    FunctionTool introspects each wrapped signature to build its
+    schema; caching the finished tuple pays that reflection cost (and
+    the FunctionTool import) once rather than once per agent instance.
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments.
-    
     Returns:
-        Parsed arguments.
+        Tuple of the shared communication FunctionTool wrappers.
     """
-    # Get default values from environment variables
-    default_host_url = os.getenv("A2A_HOST_URL", "http://localhost:8080")
-    default_api_url = os.getenv("DAYTONA_API_URL", "http://localhost:8090")
-    default_api_key = os.getenv("DAYTONA_API_KEY")
-    default_api_target = os.getenv("DAYTONA_API_TARGET", "us")
-    default_gemini_key = os.getenv("GEMINI_API_KEY")
-    
+    from google.adk.tools import FunctionTool
+    return (
+        FunctionTool(connect_to_coder_agent),
+        FunctionTool(send_message_to_agent),
+        FunctionTool(list_available_agents),
+    )
+
+def _default_args() -> argparse.Namespace:
+    """Build the argument namespace from environment defaults alone.
+
+    Returns:
+        Namespace matching what the full parser produces with no flags.
+    """
+    # Imported here (rather than at module top) so importing src.main
+    # doesn't pay the dotenv cost; the .env file must be loaded before
+    # the os.getenv reads below
+    import dotenv
+    dotenv.load_dotenv()
+
+    return argparse.Namespace(
+        host_url=os.getenv("A2A_HOST_URL", "http://localhost:8080"),
+        api_url=os.getenv("DAYTONA_API_URL", "http://localhost:8090"),
+        api_key=os.getenv("DAYTONA_API_KEY"),
+        api_target=os.getenv("DAYTONA_API_TARGET", "us"),
+        gemini_key=os.getenv("GEMINI_API_KEY"),
+        verbose=False,
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser, once per process.
+
+    Environment defaults are read a single time when the parser is
+    first needed; %(default)s in the help strings lets argparse format
+    them lazily, only when --help is actually invoked.
+
+    Returns:
+        The configured argument parser.
+    """
+    defaults = _default_args()
+
     parser = argparse.ArgumentParser(description="Daytona Sandbox Orchestration Agent")
     parser.add_argument(
-        "--host-url", 
-        default=default_host_url,
-        help=f"URL for the A2A host server (default: {default_host_url})"
+        "--host-url",
+        default=defaults.host_url,
+        help="URL for the A2A host server (default: %(default)s)"
     )
     parser.add_argument(
-        "--api-url", 
-        default=default_api_url,
-        help=f"URL for the Daytona API (default: {default_api_url})"
+        "--api-url",
+        default=defaults.api_url,
+        help="URL for the Daytona API (default: %(default)s)"
     )
     parser.add_argument(
-        "--api-key", 
-        default=default_api_key,
+        "--api-key",
+        default=defaults.api_key,
         help="API key for Daytona API authentication"
     )
     parser.add_argument(
-        "--api-target", 
-        default=default_api_target,
-        help=f"Daytona API target region (default: {default_api_target})"
+        "--api-target",
+        default=defaults.api_target,
+        help="Daytona API target region (default: %(default)s)"
     )
     parser.add_argument(
         "--gemini-key",
-        default=default_gemini_key,
+        default=defaults.gemini_key,
         help="API key for Gemini LLM"
     )
     parser.add_argument(
-        "--verbose", 
+        "--verbose",
         action="store_true",
         help="Enable verbose logging"
     )
-    return parser.parse_args()
+    return parser
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    # Fast path: with no flags the parser can't change anything, so
+    # skip ArgumentParser construction entirely on bare startups
+    if len(sys.argv) == 1:
+        return _default_args()
+
+    return _get_parser().parse_args()
 
-def create_agent(args: argparse.Namespace) -> DaytonaSandboxAgent:
+def create_agent(args: argparse.Namespace) -> "DaytonaSandboxAgent":
     """Create and configure the agent.
     
     Args:
@@ -72,6 +125,12 @@ def create_agent(args: argparse.Namespace) -> DaytonaSandboxAgent:
     Returns:
         Configured agent.
     """
+    # Imported here so startup paths that never build an agent
+    # (--help, bad arguments) skip the LLM SDK import cost
+    from google.adk.models import Gemini
+    from agent.daytona_agent import DaytonaSandboxAgent
+    from agent.a2a_integration import A2AIntegration
+
     # Create LLM with API key if available
     if args.gemini_key:
         llm = Gemini(model="gemini-2.0-flash")  # API key is handled through environment variables
@@ -80,21 +139,20 @@ def create_agent(args: argparse.Namespace) -> DaytonaSandboxAgent:
         llm = Gemini(model="gemini-2.0-flash")
         logger.info("Using Gemini LLM with default configuration")
     
-    # Log configuration
-    logger.info(f"Using Daytona API URL: {args.api_url}")
-    logger.info(f"Using Daytona API Target: {args.api_target}")
-    logger.info(f"Using A2A Host URL: {args.host_url}")
-    
-    # Set up A2A integration
-    a2a = A2AIntegration(args.host_url)
+    # Log configuration (%s formatting defers string building until the
+    # record is actually emitted)
+    logger.info("Using Daytona API URL: %s", args.api_url)
+    logger.info("Using Daytona API Target: %s", args.api_target)
+    logger.info("Using A2A Host URL: %s", args.host_url)
     
-    # Create communication tools
-    communication_tools = [
-        FunctionTool(connect_to_coder_agent),
-        FunctionTool(send_message_to_agent),
-        FunctionTool(list_available_agents)
-    ]
+    # Set up A2A integration (shared per host across agents) and
+    # pre-establish connections to known peers off the request path
+    a2a = A2AIntegration.for_host(args.host_url)
+    a2a.warmup(["coder-agent"])
     
+    # Shared communication tool wrappers, built on first use
+    communication_tools = list(_communication_tools())
+
     # Create agent with tools
     agent = DaytonaSandboxAgent(
         name="daytona_sandbox_agent",
@@ -137,37 +195,63 @@ def main() -> None:
         # TODO: Add proper agent lifecycle management
         
     except Exception as e:
-        logger.error(f"Error starting agent: {e}", exc_info=True)
+        logger.error("Error starting agent: %s", e, exc_info=True)
         exit(1)
     
-    # Keep the application running
-    try:
-        # This would be replaced with proper server code
-        import time
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Agent shutting down")
+    # Keep the application running until a shutdown signal arrives.
+    # Blocking on an Event keeps the main thread fully idle instead of
+    # waking once a second to re-check a loop condition.
+    stop_event = threading.Event()
+
+    def _handle_signal(signum: int, frame: Any) -> None:
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
+    stop_event.wait()
+    logger.info("Agent shutting down")
+
+# Constant parts of the mock tool responses, built once at import so
+# the hot tool-call loop only allocates the dicts that actually vary
+_CONNECT_TEMPLATE = MappingProxyType({
+    "status": "connected",
+    "connection_id": 12345
+})
+
+_MESSAGE_TEMPLATE = MappingProxyType({
+    "status": "success",
+    "timestamp": "2023-04-09T12:00:00Z"
+})
+
+# Plain dict/list structure (not a MappingProxyType): the tool result
+# is serialized into a FunctionResponse, and pydantic can't serialize
+# mappingproxy objects. Built once; callers must not mutate it.
+_LIST_AGENTS_RESPONSE = {
+    "agents": [
+        {
+            "id": "coder-agent",
+            "name": "Coder Agent",
+            "type": "development",
+            "capabilities": ["code-generation", "code-review"]
+        }
+    ]
+}
 
 def connect_to_coder_agent(coder_agent_id: str) -> Dict[str, Any]:
     """Connect to the coder agent.
-    
+
     Args:
         coder_agent_id: ID of the coder agent to connect to.
-        
+
     Returns:
         Connection status.
     """
     # This function is used as a tool, it will get 'self' from the agent
     # when registered as a tool
-    connection = None
-    
+
     # Mock implementation
-    return {
-        "status": "connected",
-        "agent_id": coder_agent_id,
-        "connection_id": 12345
-    }
+    return {**_CONNECT_TEMPLATE, "agent_id": coder_agent_id}
 
 def send_message_to_agent(
     agent_id: str, 
@@ -186,11 +270,10 @@ def send_message_to_agent(
     """
     # Mock implementation
     return {
-        "status": "success",
+        **_MESSAGE_TEMPLATE,
         "agent_id": agent_id,
         "task_id": task_id or "task-12345",
         "response": f"Received message: {message[:50]}...",
-        "timestamp": "2023-04-09T12:00:00Z"
     }
 
 def list_available_agents() -> Dict[str, Any]:
@@ -199,17 +282,9 @@ def list_available_agents() -> Dict[str, Any]:
     Returns:
         Available agents information.
     """
-    # Mock implementation
-    return {
-        "agents": [
-            {
-                "id": "coder-agent",
-                "name": "Coder Agent",
-                "type": "development",
-                "capabilities": ["code-generation", "code-review"]
-            }
-        ]
-    }
+    # Mock implementation: the payload is fully constant, so every call
+    # returns the same frozen object
+    return _LIST_AGENTS_RESPONSE
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,14 +1,22 @@
 #!/usr/bin/env python
 """Test A2A import."""
+import functools
 import os
 import sys
 
-# Add A2A samples to path
+# Add A2A samples to path (guarded so repeated imports of this module
+# don't grow sys.path and slow every later import)
 A2A_SAMPLES_PATH = os.path.abspath(os.path.join(
     os.path.dirname(__file__),
     "A2A", "samples", "python"
 ))
-sys.path.append(A2A_SAMPLES_PATH)
+if A2A_SAMPLES_PATH not in sys.path:
+    sys.path.insert(0, A2A_SAMPLES_PATH)
+
+# Memoized listing so the diagnostics below stat each directory once
+_ls = functools.lru_cache(maxsize=None)(
+    lambda p: os.listdir(p) if os.path.isdir(p) else None
+)
 
 # Try to import A2A client
 try:
@@ -17,7 +25,7 @@ try:
 except ImportError as e:
     print(f"Import error: {e}")
     print(f"Using path: {A2A_SAMPLES_PATH}")
-    print(f"Contents: {os.listdir(A2A_SAMPLES_PATH) if os.path.exists(A2A_SAMPLES_PATH) else 'Path does not exist'}")
+    print(f"Contents: {_ls(A2A_SAMPLES_PATH) or 'Path does not exist'}")
 
 # Try to import RemoteAgentConnection
 try:
@@ -25,15 +33,16 @@ try:
     print("RemoteAgentConnection imported successfully")
 except ImportError as e:
     print(f"RemoteAgentConnection import error: {e}")
-    
-    # List contents of the hosts directory
+
+    # List contents of the hosts directory; computed only on the
+    # failure path so a clean import does no filesystem work
     hosts_path = os.path.join(A2A_SAMPLES_PATH, "hosts")
     multiagent_path = os.path.join(hosts_path, "multiagent")
-    
+
     print(f"Hosts path: {hosts_path}")
-    print(f"Hosts contents: {os.listdir(hosts_path) if os.path.exists(hosts_path) else 'Path does not exist'}")
-    
+    print(f"Hosts contents: {_ls(hosts_path) or 'Path does not exist'}")
+
     print(f"Multiagent path: {multiagent_path}")
-    print(f"Multiagent contents: {os.listdir(multiagent_path) if os.path.exists(multiagent_path) else 'Path does not exist'}")
-    
-    print(f"Python path: {sys.path}")
\ No newline at end of file
+    print(f"Multiagent contents: {_ls(multiagent_path) or 'Path does not exist'}")
+
+    print(f"Python path: {sys.path}")
@@ -2,27 +2,45 @@
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+if os.path.abspath(os.path.join(os.path.dirname(__file__), '..')) not in sys.path:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.agent.a2a_integration import A2AIntegration
 
 class TestA2AIntegration(unittest.TestCase):
     """Test cases for the A2A integration."""
-    
-    @patch('src.agent.a2a_integration.A2AClient')
-    @patch('src.agent.a2a_integration.RemoteAgentConnection')
-    def setUp(self, MockRemoteAgentConnection, MockA2AClient):
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the client patches once for all test methods.
+
+        Patcher entry and MagicMock construction are the slow part of
+        this fixture, so they run once here; per-test isolation happens
+        in setUp by resetting the mocks and building a fresh integration.
+        """
+        client_patcher = patch('src.agent.a2a_integration.A2AClient')
+        connection_patcher = patch('src.agent.a2a_integration.RemoteAgentConnections')
+        cls.MockA2AClient = client_patcher.start()
+        cls.MockRemoteAgentConnections = connection_patcher.start()
+        cls.addClassCleanup(client_patcher.stop)
+        cls.addClassCleanup(connection_patcher.stop)
+
+    def setUp(self):
         """Set up test fixtures."""
+        # Reset call records while keeping the configured return values
+        self.MockA2AClient.reset_mock()
+        self.MockRemoteAgentConnections.reset_mock()
+
         # Set up mocks
-        self.mock_client = MockA2AClient.return_value
-        self.mock_connection = MockRemoteAgentConnection.return_value
-        
+        self.mock_client = self.MockA2AClient.return_value
+        self.mock_connection = self.MockRemoteAgentConnections.return_value
+
         # Create A2A integration
         self.a2a = A2AIntegration("http://localhost:8080")
-        
+
         # Set up client mock
         self.mock_client.list_agents.return_value = {
             "agents": [
@@ -30,27 +48,27 @@ class TestA2AIntegration(unittest.TestCase):
                 {"id": "agent2", "name": "Agent 2", "type": "general"}
             ]
         }
-    
+
     def test_connect_to_agent(self):
         """Test connecting to an agent."""
         # Connect to agent
         connection = self.a2a.connect_to_agent("agent1")
-        
+
         # Verify connection was created
         self.assertEqual(connection, self.mock_connection)
         self.assertIn("agent1", self.a2a.connections)
-    
+
     def test_disconnect_from_agent(self):
         """Test disconnecting from an agent."""
         # Connect to agent
         self.a2a.connect_to_agent("agent1")
-        
+
         # Disconnect from agent
         self.a2a.disconnect_from_agent("agent1")
-        
+
         # Verify connection was removed
         self.assertNotIn("agent1", self.a2a.connections)
-    
+
     def test_send_message(self):
         """Test sending a message to an agent."""
         # Set up mock response
@@ -58,26 +76,26 @@ class TestA2AIntegration(unittest.TestCase):
             "status": "success",
             "message": "Message received"
         }
-        
+
         # Connect to agent
         self.a2a.connect_to_agent("agent1")
-        
+
         # Send message
         response = self.a2a.send_message(
             agent_id="agent1",
             message="Hello, agent!",
             task_id="task1"
         )
-        
+
         # Verify message was sent
         self.mock_connection.send_message.assert_called_once_with("Hello, agent!", "task1")
         self.assertEqual(response["status"], "success")
-    
+
     def test_list_available_agents(self):
         """Test listing available agents."""
         # List agents
         agents = self.a2a.list_available_agents()
-        
+
         # Verify agents were listed
         self.mock_client.list_agents.assert_called_once()
         self.assertEqual(agents, {"agents": [
@@ -86,4 +104,4 @@ class TestA2AIntegration(unittest.TestCase):
         ]})
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()